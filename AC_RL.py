@@ -24,17 +24,94 @@ try:
 except Exception:
     _socket_ext = None
 
+try:
+    import select
+except Exception:
+    select = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(data):
+        return json.loads(str(data, "utf-8"))
+
+
+try:
+    import msgspec
+except Exception:
+    msgspec = None
+
+# Telemetry wire format: "msgpack" (needs msgspec) or "json" for easier debugging
+TELEMETRY_FORMAT = os.environ.get("AC_RL_TELEMETRY_FORMAT", "msgpack").lower()
+if msgspec is None or TELEMETRY_FORMAT != "msgpack":
+    TELEMETRY_FORMAT = "json"
+
+if TELEMETRY_FORMAT == "msgpack":
+    # The payload is a plain dict mutated in place each frame; msgspec encodes it
+    # as nested msgpack maps, which the receiver decodes into schema.Payload.
+    _encoder = msgspec.msgpack.Encoder()
+    # Reused for every frame; encode_into resizes it to each message's length,
+    # which can still reallocate when the size changes, but saves building a
+    # new bytes object per encode
+    _SEND_BUF = bytearray()
+
+    def _encode(obj):
+        _encoder.encode_into(obj, _SEND_BUF)
+        return _SEND_BUF
+
+    # the fallback file stays JSON so it can be read by hand
+    _file_dumps = msgspec.json.encode
+else:
+    _encoder = None
+    _encode = _dumps
+    # None: the fallback file reuses the bytes already encoded for UDP
+    _file_dumps = None
+
 from IS_ACUtil import *
 
+# file_log only buffers; _flush_log appends the buffer to the debug log in one
+# write once it holds LOG_FLUSH_LINES lines or LOG_FLUSH_INTERVAL has passed
+LOG_FLUSH_INTERVAL = 1.0
+LOG_FLUSH_LINES = 32
+_LOG_BUF = []
+_LOG_LAST_FLUSH = time.time()
+
 
 def file_log(msg):
+    _LOG_BUF.append("%s %s\n" % (time.strftime("%Y-%m-%d %H:%M:%S"), msg))
+
+
+def _flush_log(force=False):
+    global _LOG_LAST_FLUSH
+    if not _LOG_BUF:
+        return
+    now = time.time()
+    if (
+        not force
+        and len(_LOG_BUF) < LOG_FLUSH_LINES
+        and now - _LOG_LAST_FLUSH <= LOG_FLUSH_INTERVAL
+    ):
+        return
+    _LOG_LAST_FLUSH = now
+    lines = "".join(_LOG_BUF)
+    del _LOG_BUF[:]
     try:
         path = os.path.join(os.path.dirname(__file__), "AC_RL_debug.log")
         with open(path, "a", encoding="utf-8") as f:
-            f.write("%s %s\n" % (time.strftime("%Y-%m-%d %H:%M:%S"), msg))
+            f.write(lines)
     except Exception:
         try:
-            ac.log("[AC_RL] %s" % msg)
+            ac.log("[AC_RL] %s" % lines.rstrip("\n"))
         except Exception:
             pass
 
@@ -59,23 +136,76 @@ except Exception as e:
         pass
 
 
-def safe_call(mod, name, *args, default=None):
-    try:
-        if mod is None:
-            return default
-        fn = getattr(mod, name, None)
-        if fn is None:
-            return default
-        return fn(*args)
-    except Exception as e:
-        try:
-            file_log(
-                "safe_call error %s.%s: %s"
-                % (getattr(mod, "__name__", str(mod)), name, e)
-            )
-        except Exception:
-            pass
-        return default
+def _missing(*args, **kwargs):
+    return None
+
+
+def _bind(mod, name):
+    """Resolve mod.name once, or a stub returning None when it is unavailable."""
+    fn = getattr(mod, name, None) if mod is not None else None
+    return fn if callable(fn) else _missing
+
+
+# ac_api getters, resolved once so the per-frame update calls them directly
+_gtw = _bind(tyre_info, "get_tyre_wear_value")
+_gtd = _bind(tyre_info, "get_tyre_dirty")
+_gtp = _bind(tyre_info, "get_tyre_pressure")
+_gtt = _bind(tyre_info, "get_tyre_temp")
+_gsr = _bind(tyre_info, "get_slip_ratio")
+_gsa = _bind(tyre_info, "get_slip_angle")
+_ghv = _bind(tyre_info, "get_tyre_heading_vector")
+_gas = _bind(tyre_info, "get_angular_speed")
+
+_si_session_type = _bind(session_info, "get_session_type")
+_si_driver_name = _bind(session_info, "get_driver_name")
+_si_track_name = _bind(session_info, "get_track_name")
+_si_track_config = _bind(session_info, "get_track_config")
+_si_track_length = _bind(session_info, "get_track_length")
+_si_cars_count = _bind(session_info, "get_cars_count")
+_si_session_status = _bind(session_info, "get_session_status")
+_si_air_temp = _bind(session_info, "get_air_temp")
+_si_road_temp = _bind(session_info, "get_road_temp")
+
+_ci_speed = _bind(car_info, "get_speed")
+_ci_location = _bind(car_info, "get_location")
+_ci_world_location = _bind(car_info, "get_world_location")
+_ci_position = _bind(car_info, "get_position")
+_ci_drs_available = _bind(car_info, "get_drs_available")
+_ci_drs_enabled = _bind(car_info, "get_drs_enabled")
+_ci_gear = _bind(car_info, "get_gear")
+_ci_rpm = _bind(car_info, "get_rpm")
+_ci_fuel = _bind(car_info, "get_fuel")
+_ci_tyres_off_track = _bind(car_info, "get_tyres_off_track")
+_ci_in_pit_lane = _bind(car_info, "get_car_in_pit_lane")
+_ci_damage = _bind(car_info, "get_total_damage")
+_ci_cg_height = _bind(car_info, "get_cg_height")
+_ci_drive_train_speed = _bind(car_info, "get_drive_train_speed")
+_ci_velocity = _bind(car_info, "get_velocity")
+_ci_acceleration = _bind(car_info, "get_acceleration")
+
+_ii_gas = _bind(input_info, "get_gas_input")
+_ii_brake = _bind(input_info, "get_brake_input")
+_ii_clutch = _bind(input_info, "get_clutch")
+_ii_steer = _bind(input_info, "get_steer_input")
+_ii_last_ff = _bind(input_info, "get_last_ff")
+
+_li_current_lap_time = _bind(lap_info, "get_current_lap_time")
+_li_last_lap_time = _bind(lap_info, "get_last_lap_time")
+_li_best_lap_time = _bind(lap_info, "get_best_lap_time")
+_li_splits = _bind(lap_info, "get_splits")
+_li_split = _bind(lap_info, "get_split")
+_li_invalid = _bind(lap_info, "get_invalid")
+_li_lap_count = _bind(lap_info, "get_lap_count")
+_li_laps = _bind(lap_info, "get_laps")
+_li_lap_delta = _bind(lap_info, "get_lap_delta")
+_li_current_sector = _bind(lap_info, "get_current_sector")
+
+_cs_has_drs = _bind(car_stats, "get_has_drs")
+_cs_has_ers = _bind(car_stats, "get_has_ers")
+_cs_has_kers = _bind(car_stats, "get_has_kers")
+_cs_abs_level = _bind(car_stats, "abs_level")
+_cs_max_rpm = _bind(car_stats, "get_max_rpm")
+_cs_max_fuel = _bind(car_stats, "get_max_fuel")
 
 
 # --- Socket helpers -------------------------------------------------
@@ -86,6 +216,27 @@ def _create_udp_socket(bind=False, host="127.0.0.1", port=0, blocking=False):
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         if bind:
             s.bind((host, int(port)))
+        else:
+            # Sender: a larger send buffer absorbs bursts without blocking the
+            # render thread, and connecting fixes the route once so each frame
+            # can use send() instead of sendto().
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except Exception as e:
+                try:
+                    file_log("Could not set SO_SNDBUF: %s" % e)
+                except Exception:
+                    pass
+            try:
+                s.connect((host, int(port)))
+            except Exception as e:
+                try:
+                    file_log(
+                        "Could not connect UDP socket to %s:%s, using sendto: %s"
+                        % (host, port, e)
+                    )
+                except Exception:
+                    pass
         s.setblocking(bool(blocking))
         return s
     except Exception as e:
@@ -99,6 +250,13 @@ def _create_udp_socket(bind=False, host="127.0.0.1", port=0, blocking=False):
         return None
 
 
+def _is_connected(sock):
+    try:
+        return sock is not None and bool(sock.getpeername())
+    except Exception:
+        return False
+
+
 def _close_socket(sock, name=None):
     try:
         if sock:
@@ -114,6 +272,223 @@ def _close_socket(sock, name=None):
         pass
 
 
+_mmsg = None  # (ctypes, libc, iovec, mmsghdr) once _mmsg_types() has run
+
+
+def _mmsg_types():
+    """Load libc and define the iovec/mmsghdr structs shared by recvmmsg/sendmmsg."""
+    global _mmsg
+    if _mmsg is None:
+        import ctypes
+
+        class _iovec(ctypes.Structure):
+            _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+        class _msghdr(ctypes.Structure):
+            _fields_ = [
+                ("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int),
+            ]
+
+        class _mmsghdr(ctypes.Structure):
+            _fields_ = [("msg_hdr", _msghdr), ("msg_len", ctypes.c_uint)]
+
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        _mmsg = (ctypes, libc, _iovec, _mmsghdr)
+    return _mmsg
+
+
+# Receive buffers shared by every input drain, so no bytes object is
+# allocated per datagram
+_RECV_BATCH = 16
+_RECV_BUFS = [bytearray(4096) for _ in range(_RECV_BATCH)]
+_RECV_VIEWS = [memoryview(b) for b in _RECV_BUFS]
+_recvmmsg = None  # ctypes state for libc recvmmsg; False when unavailable
+
+
+def _init_recvmmsg():
+    """Build the mmsghdr array used by libc recvmmsg, pointing at _RECV_BUFS."""
+    if not sys.platform.startswith("linux"):
+        return False
+    ctypes, libc, _iovec, _mmsghdr = _mmsg_types()
+
+    fn = libc.recvmmsg
+    fn.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    fn.restype = ctypes.c_int
+
+    iovs = (_iovec * _RECV_BATCH)()
+    # one sockaddr_in per message so the sender address can be reported
+    names = ((ctypes.c_ubyte * 16) * _RECV_BATCH)()
+    msgs = (_mmsghdr * _RECV_BATCH)()
+    for i, buf in enumerate(_RECV_BUFS):
+        iovs[i].iov_base = ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+        iovs[i].iov_len = len(buf)
+        hdr = msgs[i].msg_hdr
+        hdr.msg_name = ctypes.addressof(names[i])
+        hdr.msg_iov = ctypes.pointer(iovs[i])
+        hdr.msg_iovlen = 1
+    return fn, msgs, names, iovs
+
+
+def _recv_batch(sock):
+    """Yield (memoryview, addr) for every datagram pending on a non-blocking socket.
+
+    Views point into _RECV_BUFS and are only valid until the next item is requested.
+    """
+    global _recvmmsg
+    import socket
+
+    dontwait = getattr(socket, "MSG_DONTWAIT", 0)
+    if _recvmmsg is None:
+        try:
+            _recvmmsg = _init_recvmmsg()
+        except Exception as e:
+            _recvmmsg = False
+            try:
+                file_log("recvmmsg unavailable, using recvfrom_into: %s" % e)
+            except Exception:
+                pass
+
+    if _recvmmsg:
+        fn, msgs, names, iovs = _recvmmsg
+        fd = sock.fileno()
+        while True:
+            for i in range(_RECV_BATCH):
+                msgs[i].msg_hdr.msg_namelen = 16
+            count = fn(fd, msgs, _RECV_BATCH, dontwait, None)
+            if count <= 0:
+                return
+            for i in range(count):
+                name = names[i]
+                addr = ("%d.%d.%d.%d" % tuple(name[4:8]), name[2] << 8 | name[3])
+                yield _RECV_VIEWS[i][: msgs[i].msg_len], addr
+            if count < _RECV_BATCH:
+                return
+
+    buf = _RECV_BUFS[0]
+    while True:
+        try:
+            n, addr = sock.recvfrom_into(buf, 0, dontwait)
+        except (BlockingIOError, OSError):
+            return
+        yield _RECV_VIEWS[0][:n], addr
+
+
+# Outgoing datagrams for the current frame, flushed by one _send_batch call
+_OUT_DATAGRAMS = []
+_SEND_BATCH = 64
+_sendmmsg = None  # ctypes state for libc sendmmsg; False when unavailable
+
+
+def _init_sendmmsg():
+    """Preallocate the mmsghdr/iovec arrays used by libc sendmmsg."""
+    if not sys.platform.startswith("linux"):
+        return False
+    ctypes, libc, _iovec, _mmsghdr = _mmsg_types()
+
+    fn = libc.sendmmsg
+    fn.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    fn.restype = ctypes.c_int
+
+    iovs = (_iovec * _SEND_BATCH)()
+    msgs = (_mmsghdr * _SEND_BATCH)()
+    for i in range(_SEND_BATCH):
+        hdr = msgs[i].msg_hdr
+        hdr.msg_iov = ctypes.pointer(iovs[i])
+        hdr.msg_iovlen = 1
+    # destination sockaddr_in, rebuilt only when the target address changes
+    name = (ctypes.c_ubyte * 16)()
+    return [fn, msgs, iovs, name, None]
+
+
+def _send_batch(sock, datagrams, addr=None):
+    """Send every datagram in `datagrams` to `addr` (None for a connected socket).
+
+    A single datagram goes through sendto; on Linux larger batches are handed to
+    libc sendmmsg in one syscall, elsewhere they are sent one by one.
+    """
+    global _sendmmsg
+    if len(datagrams) > 1 and _sendmmsg is None:
+        try:
+            _sendmmsg = _init_sendmmsg()
+        except Exception as e:
+            _sendmmsg = False
+            try:
+                file_log("sendmmsg unavailable, using sendto: %s" % e)
+            except Exception:
+                pass
+
+    if len(datagrams) <= 1 or not _sendmmsg:
+        for d in datagrams:
+            if addr is None:
+                sock.send(d)
+            else:
+                sock.sendto(d, addr)
+        return
+
+    import socket
+
+    ctypes = _mmsg[0]
+    fn, msgs, iovs, name, name_addr = _sendmmsg
+    if addr is not None and addr != name_addr:
+        packed = (
+            socket.AF_INET.to_bytes(2, sys.byteorder)
+            + int(addr[1]).to_bytes(2, "big")
+            + socket.inet_aton(socket.gethostbyname(addr[0]))
+        )
+        name[: len(packed)] = packed
+        _sendmmsg[4] = addr
+
+    fd = sock.fileno()
+    for start in range(0, len(datagrams), _SEND_BATCH):
+        chunk = datagrams[start : start + _SEND_BATCH]
+        # keep the ctypes views alive (and bytearrays pinned) until the call returns
+        views = []
+        for i, d in enumerate(chunk):
+            if isinstance(d, bytes):
+                ptr = ctypes.c_char_p(d)
+                iovs[i].iov_base = ctypes.cast(ptr, ctypes.c_void_p).value
+            else:
+                view = (ctypes.c_char * len(d)).from_buffer(d)
+                views.append(view)
+                iovs[i].iov_base = ctypes.addressof(view)
+            iovs[i].iov_len = len(d)
+            hdr = msgs[i].msg_hdr
+            if addr is None:
+                hdr.msg_name = None
+                hdr.msg_namelen = 0
+            else:
+                hdr.msg_name = ctypes.addressof(name)
+                hdr.msg_namelen = 16
+        count = fn(fd, msgs, len(chunk), 0)
+        del views
+        if count < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        # sendmmsg may stop early; push the remainder through sendto
+        for d in chunk[count:]:
+            if addr is None:
+                sock.send(d)
+            else:
+                sock.sendto(d, addr)
+
+
 def call_sendcmd(*args, **kwargs):
     """Safe wrapper around sendCMD provided by IS_ACUtil or fallback to ac.sendCommand if available."""
     try:
@@ -137,12 +512,14 @@ width, height = 800, 800
 
 
 TELEMETRY_FILENAME = "AC_RL_telemetry.json"
+INPUT_FILENAME = "AC_RL_input.json"
 
 # Output UDP telemetry defaults
 TELEMETRY_UDP_HOST = "127.0.0.1"
 TELEMETRY_UDP_PORT = 9876
 telemetry_sock = None
 telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
+telemetry_connected = False  # telemetry_sock is connected to telemetry_addr
 
 # Input UDP defaults
 INPUT_UDP_HOST = "127.0.0.1"
@@ -150,190 +527,358 @@ INPUT_UDP_PORT = 9877
 input_sock = None
 input_addr = (INPUT_UDP_HOST, INPUT_UDP_PORT)
 
+# Input file is polled on a timer; UDP commands are drained every frame
+INPUT_FILE_POLL_INTERVAL = 1.0
+_last_file_check = 0.0
+
+# File paths under the AC documents folder, resolved once in acMain since
+# ac.getDocumentsPath() crosses into the game DLL. The input file may also live
+# next to this app (_ALT_INPUT_PATH).
+_INPUT_PATH = os.path.join(here, INPUT_FILENAME)
+_ALT_INPUT_PATH = os.path.join(here, INPUT_FILENAME)
+_TELEMETRY_PATH = os.path.join(here, TELEMETRY_FILENAME)
+_TMP_TELEMETRY_PATH = _TELEMETRY_PATH + ".tmp"
+# (path, st_mtime_ns) of the last input file that was read; unchanged files are skipped
+_INPUT_STAMP = None
+
+# Telemetry payload, allocated once in acMain and updated in place by acUpdate
+_PAYLOAD = None
+
+# Written over every tyre list when a tyre getter raises
+_NO_TYRES = (None, None, None, None)
+_tyre_read_failed = False  # only the first error of a failing streak is logged
+
+# Tyre labels are for humans, so they refresh at ~10 Hz while telemetry goes out
+# every frame. AC's embedded Python predates f-strings, hence the % template.
+LABEL_UPDATE_INTERVAL = 0.1
+_last_label_update = 0.0
+_TYRE_LABEL_FMT = (
+    "Tyre %d - Wear: %.1f%%  Dirty: %.1f\n"
+    "Pressure: %.2f  Temps (I/M/O): %.1f/%.1f/%.1f"
+)
+
+
+def _new_payload():
+    return {
+        "app": appName,
+        "timestamp": 0.0,
+        "session": {
+            "session_type": None,
+            "driver_name": None,
+            "track_name": None,
+            "track_config": None,
+            "track_length": None,
+            "cars_count": None,
+            "session_status": None,
+            "air_temp": None,
+            "road_temp": None,
+        },
+        "car": {
+            "speed_kmh": None,
+            "speed_mph": None,
+            "speed_ms": None,
+            "location": None,
+            "world_location": None,
+            "position": None,
+            "drs_available": None,
+            "drs_enabled": None,
+            "gear": None,
+            "rpm": None,
+            "fuel": None,
+            "tyres_off_track": None,
+            "in_pit_lane": None,
+            "damage": None,
+            "cg_height": None,
+            "drive_train_speed": None,
+            "velocity": None,
+            "acceleration": None,
+        },
+        "inputs": {
+            "gas": None,
+            "brake": None,
+            "clutch": None,
+            "steer": None,
+            "last_ff": None,
+        },
+        "lap": {
+            "get_current_lap_time": None,
+            "get_last_lap_time": None,
+            "get_best_lap_time": None,
+            "get_splits": None,
+            "get_split": None,
+            "get_invalid": None,
+            "get_lap_count": None,
+            "get_laps": None,
+            "get_lap_delta": None,
+            "get_current_sector": None,
+        },
+        # one list per field, indexed by tyre (0 = FL, 1 = FR, 2 = RL, 3 = RR)
+        "tyres": {
+            "wear": [None] * 4,
+            "dirty": [None] * 4,
+            "pressure": [None] * 4,
+            "temp_i": [None] * 4,
+            "temp_m": [None] * 4,
+            "temp_o": [None] * 4,
+            "slip_ratio": [None] * 4,
+            "slip_angle": [None] * 4,
+            "heading_vector": [None] * 4,
+            "angular_speed": [None] * 4,
+        },
+        "stats": {
+            "has_drs": None,
+            "has_ers": None,
+            "has_kers": None,
+            "abs_level": None,
+            "max_rpm": None,
+            "max_fuel": None,
+        },
+    }
+
+
+def _open_telemetry_socket():
+    """Create the telemetry socket for the current target, connected when possible."""
+    global telemetry_sock, telemetry_addr, telemetry_connected
+    telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
+    telemetry_sock = _create_udp_socket(
+        bind=False, host=TELEMETRY_UDP_HOST, port=TELEMETRY_UDP_PORT, blocking=True
+    )
+    telemetry_connected = _is_connected(telemetry_sock)
+    return telemetry_sock
 
-def handle_input_data(cmd, path=None):
+
+def _read_target(cmd, prefix, host, port):
+    """Read <prefix>_host/<prefix>_port from cmd, defaulting to the current target."""
+    return (
+        cmd.get(prefix + "_host", host),
+        int(cmd.get(prefix + "_port", port)),
+    )
+
+
+def _set_telemetry_target(cmd, path):
+    global TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT, telemetry_addr
     try:
-        if not isinstance(cmd, dict):
-            return
-    except Exception:
+        host, port = _read_target(
+            cmd, "telemetry_udp", TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT
+        )
+    except Exception as e:
+        try:
+            file_log("Invalid telemetry_udp_port in input: %s" % e)
+        except Exception:
+            pass
         return
-
+    changed = (host, port) != (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
+    TELEMETRY_UDP_HOST = host
+    TELEMETRY_UDP_PORT = port
+    telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
+    # Reconnect an open socket so it sends to the new target
+    if changed and telemetry_sock:
+        try:
+            telemetry_sock.close()
+        except Exception:
+            pass
+        _open_telemetry_socket()
     try:
-        global TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT, telemetry_addr, telemetry_sock
-        global INPUT_UDP_HOST, INPUT_UDP_PORT, input_addr, input_sock
+        file_log("Telemetry UDP target updated to %s:%d via input" % telemetry_addr)
+    except Exception:
+        pass
 
-        if "telemetry_udp_host" in cmd or "telemetry_udp_port" in cmd:
-            host = cmd.get("telemetry_udp_host", TELEMETRY_UDP_HOST)
-            port = cmd.get("telemetry_udp_port", TELEMETRY_UDP_PORT)
+
+def _toggle_telemetry(cmd, path):
+    global telemetry_sock
+    use_udp = bool(cmd.get("use_udp_telemetry"))
+    if not use_udp and telemetry_sock:
+        _close_socket(telemetry_sock, "telemetry")
+        telemetry_sock = None
+        try:
+            file_log("Telemetry UDP disabled via input")
+        except Exception:
+            pass
+    elif use_udp and telemetry_sock is None:
+        try:
+            _open_telemetry_socket()
             try:
-                port = int(port)
-                TELEMETRY_UDP_HOST = host
-                TELEMETRY_UDP_PORT = port
-                telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
-                try:
-                    file_log(
-                        "Telemetry UDP target updated to %s:%d via input"
-                        % telemetry_addr
-                    )
-                except Exception:
-                    pass
-            except Exception as e:
-                try:
-                    file_log("Invalid telemetry_udp_port in input: %s" % e)
-                except Exception:
-                    pass
+                file_log("Telemetry UDP enabled via input to %s:%d" % telemetry_addr)
+            except Exception:
+                pass
+        except Exception as e:
+            try:
+                file_log("Could not enable telemetry UDP via input: %s" % e)
+            except Exception:
+                pass
 
-        if "use_udp_telemetry" in cmd:
-            use_udp = bool(cmd.get("use_udp_telemetry"))
-            if not use_udp and telemetry_sock:
-                _close_socket(telemetry_sock, "telemetry")
-                telemetry_sock = None
-                try:
-                    file_log("Telemetry UDP disabled via input")
-                except Exception:
-                    pass
-            elif use_udp and telemetry_sock is None:
-                try:
-                    telemetry_sock = _create_udp_socket(
-                        bind=False,
-                        host=TELEMETRY_UDP_HOST,
-                        port=TELEMETRY_UDP_PORT,
-                        blocking=True,
-                    )
-                    telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
-                    try:
-                        file_log(
-                            "Telemetry UDP enabled via input to %s:%d" % telemetry_addr
-                        )
-                    except Exception:
-                        pass
-                except Exception as e:
-                    try:
-                        file_log("Could not enable telemetry UDP via input: %s" % e)
-                    except Exception:
-                        pass
 
-        if "input_udp_host" in cmd or "input_udp_port" in cmd:
-            host = cmd.get("input_udp_host", INPUT_UDP_HOST)
-            port = cmd.get("input_udp_port", INPUT_UDP_PORT)
+def _set_input_target(cmd, path):
+    global INPUT_UDP_HOST, INPUT_UDP_PORT, input_addr, input_sock
+    try:
+        host, port = _read_target(cmd, "input_udp", INPUT_UDP_HOST, INPUT_UDP_PORT)
+    except Exception as e:
+        try:
+            file_log("Invalid input_udp_port in input: %s" % e)
+        except Exception:
+            pass
+        return
+    changed = (host, port) != (INPUT_UDP_HOST, INPUT_UDP_PORT)
+    INPUT_UDP_HOST = host
+    INPUT_UDP_PORT = port
+    input_addr = (INPUT_UDP_HOST, INPUT_UDP_PORT)
+    # Rebinding an unchanged address would only drop queued commands
+    if input_sock and not changed:
+        return
+    if input_sock:
+        try:
+            input_sock.close()
+        except Exception:
+            pass
+        input_sock = None
+    try:
+        input_sock = _create_udp_socket(
+            bind=True, host=INPUT_UDP_HOST, port=INPUT_UDP_PORT, blocking=False
+        )
+        try:
+            file_log("Input UDP socket bound to %s:%d" % input_addr)
+        except Exception:
+            pass
+    except Exception as e:
+        try:
+            file_log("Could not bind input UDP socket: %s" % e)
+        except Exception:
+            pass
+
+
+def _toggle_input(cmd, path):
+    global input_sock
+    use_in = bool(cmd.get("use_input_udp"))
+    if not use_in and input_sock:
+        _close_socket(input_sock, "input")
+        input_sock = None
+        try:
+            file_log("Input UDP disabled via input")
+        except Exception:
+            pass
+    elif use_in and input_sock is None:
+        try:
+            input_sock = _create_udp_socket(
+                bind=True, host=INPUT_UDP_HOST, port=INPUT_UDP_PORT, blocking=False
+            )
             try:
-                port = int(port)
-                INPUT_UDP_HOST = host
-                INPUT_UDP_PORT = port
-                input_addr = (INPUT_UDP_HOST, INPUT_UDP_PORT)
-                if input_sock:
-                    try:
-                        input_sock.close()
-                    except Exception:
-                        pass
-                    input_sock = None
-                try:
-                    input_sock = _create_udp_socket(
-                        bind=True,
-                        host=INPUT_UDP_HOST,
-                        port=INPUT_UDP_PORT,
-                        blocking=False,
-                    )
-                    try:
-                        file_log("Input UDP socket bound to %s:%d" % input_addr)
-                    except Exception:
-                        pass
-                except Exception as e:
-                    try:
-                        file_log("Could not bind input UDP socket: %s" % e)
-                    except Exception:
-                        pass
-            except Exception as e:
-                try:
-                    file_log("Invalid input_udp_port in input: %s" % e)
-                except Exception:
-                    pass
+                file_log(
+                    "Input UDP enabled via input to %s:%d"
+                    % (INPUT_UDP_HOST, INPUT_UDP_PORT)
+                )
+            except Exception:
+                pass
+        except Exception as e:
+            try:
+                file_log("Could not enable input UDP via input: %s" % e)
+            except Exception:
+                pass
 
-        if "use_input_udp" in cmd:
-            use_in = bool(cmd.get("use_input_udp"))
-            if not use_in and input_sock:
-                _close_socket(input_sock, "input")
-                input_sock = None
-                try:
-                    file_log("Input UDP disabled via input")
-                except Exception:
-                    pass
-            elif use_in and input_sock is None:
-                try:
-                    input_sock = _create_udp_socket(
-                        bind=True,
-                        host=INPUT_UDP_HOST,
-                        port=INPUT_UDP_PORT,
-                        blocking=False,
-                    )
-                    try:
-                        file_log(
-                            "Input UDP enabled via input to %s:%d"
-                            % (INPUT_UDP_HOST, INPUT_UDP_PORT)
-                        )
-                    except Exception:
-                        pass
-                except Exception as e:
-                    try:
-                        file_log("Could not enable input UDP via input: %s" % e)
-                    except Exception:
-                        pass
 
-        if cmd.get("reset") is True:
+def _do_reset(cmd, path):
+    if cmd.get("reset") is not True:
+        return
+    try:
+        call_sendcmd(68)
+        call_sendcmd(69)
+    except Exception as e:
+        try:
+            file_log("Error calling reset command: %s" % e)
+        except Exception:
+            pass
+
+    if path:
+        try:
+            cmd["reset"] = False
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(cmd, f)
             try:
-                try:
-                    call_sendcmd(68)
-                    call_sendcmd(69)
-                except Exception as e:
-                    try:
-                        file_log("Error calling reset command: %s" % e)
-                    except Exception:
-                        pass
-            except Exception as e:
-                try:
-                    file_log("Error processing reset from input: %s" % e)
-                except Exception:
-                    pass
+                os.replace(tmp, path)
+            except Exception:
+                os.rename(tmp, path)
+        except Exception as e:
+            try:
+                file_log("Error writing input file after reset: %s" % e)
+            except Exception:
+                pass
 
-            if path:
-                try:
-                    cmd["reset"] = False
-                    tmp = path + ".tmp"
-                    with open(tmp, "w", encoding="utf-8") as f:
-                        json.dump(cmd, f)
-                    try:
-                        os.replace(tmp, path)
-                    except Exception:
-                        os.rename(tmp, path)
-                except Exception as e:
-                    try:
-                        file_log("Error writing input file after reset: %s" % e)
-                    except Exception:
-                        pass
-    except Exception:
-        pass
 
+# Command key -> handler. Handlers run at most once per command, in
+# _HANDLER_ORDER, so a target change is applied before an enable/disable.
+_HANDLERS = {
+    "telemetry_udp_host": _set_telemetry_target,
+    "telemetry_udp_port": _set_telemetry_target,
+    "use_udp_telemetry": _toggle_telemetry,
+    "input_udp_host": _set_input_target,
+    "input_udp_port": _set_input_target,
+    "use_input_udp": _toggle_input,
+    "reset": _do_reset,
+}
+_HANDLER_ORDER = (
+    _set_telemetry_target,
+    _toggle_telemetry,
+    _set_input_target,
+    _toggle_input,
+    _do_reset,
+)
+
+
+# Single-byte input UDP commands, handled without JSON parsing. Each maps to the
+# handler and command dict its JSON form would dispatch to.
+OP_RESET = 0x01  # same as {"reset": true}
+OP_ENABLE_UDP = 0x02  # same as {"use_udp_telemetry": true}
+_OPCODES = {
+    OP_RESET: (_do_reset, {"reset": True}),
+    OP_ENABLE_UDP: (_toggle_telemetry, {"use_udp_telemetry": True}),
+}
 
-def check_input_file():
+
+def handle_input_data(cmd, path=None):
+    """Apply a command dict received from the input file (path) or the input socket."""
+    if not isinstance(cmd, dict):
+        return
+
+    pending = set()
+    for key in cmd:
+        handler = _HANDLERS.get(key)
+        if handler is not None:
+            pending.add(handler)
+    if not pending:
+        return
+
+    for handler in _HANDLER_ORDER:
+        if handler in pending:
+            try:
+                handler(cmd, path)
+            except Exception:
+                pass
+
+
+def _poll_input_file():
+    global _INPUT_STAMP
     data = None
     path = None
     try:
+        path = _INPUT_PATH
         try:
-            docs = ac.getDocumentsPath()
-        except Exception:
-            docs = os.path.dirname(__file__)
-        path = os.path.join(docs, "AC_RL_input.json")
-        if not os.path.exists(path):
-            alt = os.path.join(os.path.dirname(__file__), "AC_RL_input.json")
-            if os.path.exists(alt):
-                path = alt
-            else:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            path = _ALT_INPUT_PATH
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
                 path = None
-                data = None
+                mtime = 0
+        stamp = (path, mtime)
+        if stamp == _INPUT_STAMP:
+            return
         if path:
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(path, "rb") as f:
+                    data = _loads(f.read())
+                # Only remember files that parsed, so a half-written file is retried
+                _INPUT_STAMP = stamp
             except Exception as e:
                 try:
                     file_log("Error reading input file: %s" % e)
@@ -353,15 +898,26 @@ def check_input_file():
         except Exception:
             pass
 
+
+def _poll_input_udp():
     if input_sock:
         try:
-            while True:
-                try:
-                    pkt, addr = input_sock.recvfrom(65536)
-                except (BlockingIOError, OSError) as e:
-                    break
+            # Zero-timeout readiness check: an idle socket (the common case) costs
+            # one select() instead of a failing recv and a BlockingIOError
+            if select is not None:
+                readable, _, _ = select.select((input_sock,), (), (), 0.0)
+                if not readable:
+                    return
+            for pkt, addr in _recv_batch(input_sock):
+                op = _OPCODES.get(pkt[0]) if len(pkt) == 1 else None
+                if op is not None:
+                    try:
+                        op[0](op[1], None)
+                    except Exception:
+                        pass
+                    continue
                 try:
-                    cmd = json.loads(pkt.decode("utf-8"))
+                    cmd = _loads(pkt)
                 except Exception as e:
                     try:
                         file_log("Error parsing input UDP JSON from %s: %s" % (addr, e))
@@ -380,6 +936,16 @@ def check_input_file():
                 pass
 
 
+def check_input_file():
+    """Drain input UDP commands every call; re-read the input file once per second."""
+    global _last_file_check
+    now = time.time()
+    if now - _last_file_check > INPUT_FILE_POLL_INTERVAL:
+        _last_file_check = now
+        _poll_input_file()
+    _poll_input_udp()
+
+
 def acMain(ac_version):  # ----------------------------- App window Init
     global appWindow
 
@@ -389,19 +955,7 @@ def acMain(ac_version):  # ----------------------------- App window Init
 
     ac.addRenderCallback(appWindow, appGL)
 
-    try:
-        file_log("acMain starting")
-    except NameError:
-
-        def file_log(msg):
-            try:
-                path = os.path.join(os.path.dirname(__file__), "AC_RL_debug.log")
-                with open(path, "a", encoding="utf-8") as f:
-                    f.write("%s %s\n" % (time.strftime("%Y-%m-%d %H:%M:%S"), msg))
-            except Exception:
-                pass
-
-        file_log("acMain starting")
+    file_log("acMain starting")
 
     try:
         file_log(
@@ -411,12 +965,18 @@ def acMain(ac_version):  # ----------------------------- App window Init
     except Exception:
         pass
 
+    global _INPUT_PATH, _TELEMETRY_PATH, _TMP_TELEMETRY_PATH
+    try:
+        docs = ac.getDocumentsPath()
+    except Exception:
+        docs = here
+    _INPUT_PATH = os.path.join(docs, INPUT_FILENAME)
+    _TELEMETRY_PATH = os.path.join(docs, TELEMETRY_FILENAME)
+    _TMP_TELEMETRY_PATH = _TELEMETRY_PATH + ".tmp"
+
     global telemetry_sock, telemetry_addr, input_sock, input_addr
 
-    telemetry_sock = _create_udp_socket(
-        bind=False, host=TELEMETRY_UDP_HOST, port=TELEMETRY_UDP_PORT, blocking=True
-    )
-    telemetry_addr = (TELEMETRY_UDP_HOST, TELEMETRY_UDP_PORT)
+    _open_telemetry_socket()
     if telemetry_sock:
         try:
             file_log("Telemetry UDP socket created to %s:%d" % telemetry_addr)
@@ -433,6 +993,9 @@ def acMain(ac_version):  # ----------------------------- App window Init
         except Exception:
             pass
 
+    global _PAYLOAD
+    _PAYLOAD = _new_payload()
+
     global tyre_labels
     tyre_labels = []
     for i in range(4):
@@ -446,6 +1009,8 @@ def acMain(ac_version):  # ----------------------------- App window Init
     ac.setPosition(hdr, 10, 0)
     ac.setFontSize(hdr, 16)
 
+    _flush_log(force=True)
+
     return appName
 
 
@@ -454,6 +1019,8 @@ def appGL(deltaT):  # -------------------------------- OpenGL UPDATE
 
 
 def acUpdate(deltaT):  # -------------------------------- AC UPDATE
+    global _tyre_read_failed, _last_label_update
+
     try:
         check_input_file()
     except Exception:
@@ -464,190 +1031,186 @@ def acUpdate(deltaT):  # -------------------------------- AC UPDATE
             file_log("tyre_info is None; skipping update")
         except Exception:
             pass
+        _flush_log()
         return
 
     try:
-        for t in range(4):
-            wear = tyre_info.get_tyre_wear_value(t)
-            dirty = tyre_info.get_tyre_dirty(t)
-            p = tyre_info.get_tyre_pressure(t)
-            ti = tyre_info.get_tyre_temp(t, "i")
-            tm = tyre_info.get_tyre_temp(t, "m")
-            to = tyre_info.get_tyre_temp(t, "o")
-
-            text = (
-                "Tyre {idx} - Wear: {wear:.1f}%  Dirty: {dirty:.1f}\n"
-                "Pressure: {p:.2f}  Temps (I/M/O): {ti:.1f}/{tm:.1f}/{to:.1f}"
-            ).format(idx=t, wear=wear, dirty=dirty, p=p, ti=ti, tm=tm, to=to)
-
-            ac.setText(tyre_labels[t], text)
-
+        now = time.time()
+        payload = _PAYLOAD
+        payload["timestamp"] = now
+
+        tyres = payload["tyres"]
+        wear = tyres["wear"]
+        dirty = tyres["dirty"]
+        pressure = tyres["pressure"]
+        temp_i = tyres["temp_i"]
+        temp_m = tyres["temp_m"]
+        temp_o = tyres["temp_o"]
+        slip_ratio = tyres["slip_ratio"]
+        slip_angle = tyres["slip_angle"]
+        heading_vector = tyres["heading_vector"]
+        angular_speed = tyres["angular_speed"]
         try:
-            tyres = []
             for t in range(4):
-                # TODO: do this better
-                tyres.append(
-                    {
-                        "index": t,
-                        "wear": safe_call(
-                            tyre_info, "get_tyre_wear_value", t, default=None
-                        ),
-                        "dirty": safe_call(
-                            tyre_info, "get_tyre_dirty", t, default=None
-                        ),
-                        "pressure": safe_call(
-                            tyre_info, "get_tyre_pressure", t, default=None
-                        ),
-                        "temp_i": safe_call(
-                            tyre_info, "get_tyre_temp", t, "i", default=None
-                        ),
-                        "temp_m": safe_call(
-                            tyre_info, "get_tyre_temp", t, "m", default=None
-                        ),
-                        "temp_o": safe_call(
-                            tyre_info, "get_tyre_temp", t, "o", default=None
-                        ),
-                        "slip_ratio": safe_call(
-                            tyre_info, "get_slip_ratio", t, default=None
-                        ),
-                        "slip_angle": safe_call(
-                            tyre_info, "get_slip_angle", t, default=None
-                        ),
-                        # "load": safe_call(tyre_info, 'get_load', t, default=None),
-                        "heading_vector": safe_call(
-                            tyre_info, "get_tyre_heading_vector", t, default=None
-                        ),
-                        "angular_speed": safe_call(
-                            tyre_info, "get_angular_speed", t, default=None
-                        ),
-                    }
-                )
-
-            session = {
-                "session_type": safe_call(session_info, "get_session_type"),
-                "driver_name": safe_call(session_info, "get_driver_name"),
-                "track_name": safe_call(session_info, "get_track_name"),
-                "track_config": safe_call(session_info, "get_track_config"),
-                "track_length": safe_call(session_info, "get_track_length"),
-                "cars_count": safe_call(session_info, "get_cars_count"),
-                "session_status": safe_call(session_info, "get_session_status"),
-                "air_temp": safe_call(session_info, "get_air_temp"),
-                "road_temp": safe_call(session_info, "get_road_temp"),
-                # 'tyre_compound': safe_call(session_info, 'get_tyre_compound'),
-            }
-
-            car = {
-                "speed_kmh": safe_call(car_info, "get_speed", 0, "kmh"),
-                "speed_mph": safe_call(car_info, "get_speed", 0, "mph"),
-                "speed_ms": safe_call(car_info, "get_speed", 0, "ms"),
-                "location": safe_call(car_info, "get_location", 0),
-                "world_location": safe_call(car_info, "get_world_location", 0),
-                "position": safe_call(car_info, "get_position", 0),
-                "drs_available": safe_call(car_info, "get_drs_available"),
-                "drs_enabled": safe_call(car_info, "get_drs_enabled"),
-                "gear": safe_call(car_info, "get_gear", 0, True),
-                "rpm": safe_call(car_info, "get_rpm", 0),
-                "fuel": safe_call(car_info, "get_fuel"),
-                "tyres_off_track": safe_call(car_info, "get_tyres_off_track"),
-                "in_pit_lane": safe_call(car_info, "get_car_in_pit_lane"),
-                "damage": safe_call(car_info, "get_total_damage"),
-                "cg_height": safe_call(car_info, "get_cg_height", 0),
-                "drive_train_speed": safe_call(car_info, "get_drive_train_speed", 0),
-                "velocity": safe_call(car_info, "get_velocity"),
-                "acceleration": safe_call(car_info, "get_acceleration"),
-            }
-
-            inputs = {
-                "gas": safe_call(input_info, "get_gas_input", 0),
-                "brake": safe_call(input_info, "get_brake_input", 0),
-                "clutch": safe_call(input_info, "get_clutch", 0),
-                "steer": safe_call(input_info, "get_steer_input", 0),
-                "last_ff": safe_call(input_info, "get_last_ff", 0),
-            }
-
-            lap = {
-                "get_current_lap_time": safe_call(
-                    lap_info, "get_current_lap_time", 0, False
-                ),
-                "get_last_lap_time": safe_call(lap_info, "get_last_lap_time", 0, False),
-                "get_best_lap_time": safe_call(lap_info, "get_best_lap_time", 0, False),
-                "get_splits": safe_call(lap_info, "get_splits", 0, False),
-                "get_split": safe_call(lap_info, "get_split"),
-                "get_invalid": safe_call(lap_info, "get_invalid", 0),
-                "get_lap_count": safe_call(lap_info, "get_lap_count", 0),
-                "get_laps": safe_call(lap_info, "get_laps"),
-                "get_lap_delta": safe_call(lap_info, "get_lap_delta", 0),
-                "get_current_sector": safe_call(lap_info, "get_current_sector"),
-            }
-
-            stats = {
-                "has_drs": safe_call(car_stats, "get_has_drs"),
-                "has_ers": safe_call(car_stats, "get_has_ers"),
-                "has_kers": safe_call(car_stats, "get_has_kers"),
-                "abs_level": safe_call(car_stats, "abs_level"),
-                "max_rpm": safe_call(car_stats, "get_max_rpm"),
-                "max_fuel": safe_call(car_stats, "get_max_fuel"),
-            }
-
-            payload = {
-                "app": appName,
-                "timestamp": time.time(),
-                "session": session,
-                "car": car,
-                "inputs": inputs,
-                "lap": lap,
-                "tyres": tyres,
-                "stats": stats,
-            }
-
-            sent = False
-            # Try to send telemetry over UDP first if we have a socket
-            if telemetry_sock:
+                wear[t] = _gtw(t)
+                dirty[t] = _gtd(t)
+                pressure[t] = _gtp(t)
+                temp_i[t] = _gtt(t, "i")
+                temp_m[t] = _gtt(t, "m")
+                temp_o[t] = _gtt(t, "o")
+                # load[t] = tyre_info.get_load(t)
+                heading_vector[t] = _ghv(t)
+                angular_speed[t] = _gas(t)
+            # one 4-wheel vector for the player's car, not a per-tyre getter
+            slip_ratio[:] = _gsr(0) or _NO_TYRES
+            slip_angle[:] = _gsa(0) or _NO_TYRES
+            _tyre_read_failed = False
+        except Exception as e:
+            for values in tyres.values():
+                values[:] = _NO_TYRES
+            if not _tyre_read_failed:
+                _tyre_read_failed = True
                 try:
-                    data_bytes = json.dumps(payload).encode("utf-8")
-                    telemetry_sock.sendto(data_bytes, telemetry_addr)
-                    sent = True
-                except Exception as e:
-                    try:
-                        file_log("Error sending telemetry via UDP: %s" % e)
-                    except Exception:
-                        pass
+                    file_log("Error reading tyre telemetry: %s" % e)
+                except Exception:
+                    pass
 
-            if not sent:
-                # Fall back to writing telemetry JSON to a file in AC documents path
+        # The labels show the values just read for the payload, so every
+        # tyre_info getter is called once per frame (stale labels on read errors)
+        if not _tyre_read_failed and now - _last_label_update > LABEL_UPDATE_INTERVAL:
+            _last_label_update = now
+            try:
+                for t in range(4):
+                    text = _TYRE_LABEL_FMT % (
+                        t,
+                        wear[t],
+                        dirty[t],
+                        pressure[t],
+                        temp_i[t],
+                        temp_m[t],
+                        temp_o[t],
+                    )
+                    ac.setText(tyre_labels[t], text)
+            except Exception as e:
+                ac.log("[AC_RL] Error updating tyre labels: %s" % e)
                 try:
-                    docs = ac.getDocumentsPath()
+                    file_log("Error updating tyre labels: %s" % e)
                 except Exception:
-                    docs = os.path.dirname(__file__)
+                    pass
 
-                telemetry_path = os.path.join(docs, TELEMETRY_FILENAME)
-                tmp_path = telemetry_path + ".tmp"
+        session = payload["session"]
+        session["session_type"] = _si_session_type()
+        session["driver_name"] = _si_driver_name()
+        session["track_name"] = _si_track_name()
+        session["track_config"] = _si_track_config()
+        session["track_length"] = _si_track_length()
+        session["cars_count"] = _si_cars_count()
+        session["session_status"] = _si_session_status()
+        session["air_temp"] = _si_air_temp()
+        session["road_temp"] = _si_road_temp()
+        # session["tyre_compound"] = session_info.get_tyre_compound()
+
+        car = payload["car"]
+        car["speed_kmh"] = _ci_speed(0, "kmh")
+        car["speed_mph"] = _ci_speed(0, "mph")
+        car["speed_ms"] = _ci_speed(0, "ms")
+        car["location"] = _ci_location(0)
+        car["world_location"] = _ci_world_location(0)
+        car["position"] = _ci_position(0)
+        car["drs_available"] = _ci_drs_available()
+        car["drs_enabled"] = _ci_drs_enabled()
+        car["gear"] = _ci_gear(0, True)
+        car["rpm"] = _ci_rpm(0)
+        car["fuel"] = _ci_fuel()
+        car["tyres_off_track"] = _ci_tyres_off_track()
+        car["in_pit_lane"] = _ci_in_pit_lane()
+        car["damage"] = _ci_damage()
+        car["cg_height"] = _ci_cg_height(0)
+        car["drive_train_speed"] = _ci_drive_train_speed(0)
+        car["velocity"] = _ci_velocity()
+        car["acceleration"] = _ci_acceleration()
+
+        inputs = payload["inputs"]
+        inputs["gas"] = _ii_gas(0)
+        inputs["brake"] = _ii_brake(0)
+        inputs["clutch"] = _ii_clutch(0)
+        inputs["steer"] = _ii_steer(0)
+        inputs["last_ff"] = _ii_last_ff(0)
+
+        lap = payload["lap"]
+        lap["get_current_lap_time"] = _li_current_lap_time(0, False)
+        lap["get_last_lap_time"] = _li_last_lap_time(0, False)
+        lap["get_best_lap_time"] = _li_best_lap_time(0, False)
+        lap["get_splits"] = _li_splits(0, False)
+        lap["get_split"] = _li_split()
+        lap["get_invalid"] = _li_invalid(0)
+        lap["get_lap_count"] = _li_lap_count(0)
+        lap["get_laps"] = _li_laps()
+        lap["get_lap_delta"] = _li_lap_delta(0)
+        lap["get_current_sector"] = _li_current_sector()
+
+        stats = payload["stats"]
+        stats["has_drs"] = _cs_has_drs()
+        stats["has_ers"] = _cs_has_ers()
+        stats["has_kers"] = _cs_has_kers()
+        stats["abs_level"] = _cs_abs_level()
+        stats["max_rpm"] = _cs_max_rpm()
+        stats["max_fuel"] = _cs_max_fuel()
+
+        data_bytes = _encode(payload)
+
+        sent = False
+        # Try to send telemetry over UDP first if we have a socket
+        if telemetry_sock:
+            try:
+                _OUT_DATAGRAMS.append(data_bytes)
                 try:
-                    with open(tmp_path, "w", encoding="utf-8") as f:
-                        json.dump(payload, f)
-                    try:
-                        os.replace(tmp_path, telemetry_path)
-                    except Exception:
-                        os.rename(tmp_path, telemetry_path)
-                except Exception as e:
-                    ac.log("[AC_RL] Error writing telemetry file: %s" % e)
-                    try:
-                        file_log("Error writing telemetry file: %s" % e)
-                    except Exception:
-                        pass
-        except Exception as e:
-            ac.log("[AC_RL] Error preparing telemetry payload: %s" % e)
+                    _send_batch(
+                        telemetry_sock,
+                        _OUT_DATAGRAMS,
+                        None if telemetry_connected else telemetry_addr,
+                    )
+                finally:
+                    del _OUT_DATAGRAMS[:]
+                sent = True
+            except (ConnectionRefusedError, ConnectionResetError):
+                # A connected UDP socket reports ICMP port-unreachable from an
+                # earlier datagram when nothing is listening yet; sendto()
+                # dropped those silently, so don't fall back to the file.
+                sent = True
+            except Exception as e:
+                try:
+                    file_log("Error sending telemetry via UDP: %s" % e)
+                except Exception:
+                    pass
+
+        if not sent:
+            # Fall back to writing telemetry JSON to a file in AC documents path
             try:
-                file_log("Error preparing telemetry payload: %s" % e)
-            except Exception:
-                pass
+                with open(_TMP_TELEMETRY_PATH, "wb") as f:
+                    if _file_dumps is None:
+                        f.write(data_bytes)
+                    else:
+                        f.write(_file_dumps(payload))
+                try:
+                    os.replace(_TMP_TELEMETRY_PATH, _TELEMETRY_PATH)
+                except Exception:
+                    os.rename(_TMP_TELEMETRY_PATH, _TELEMETRY_PATH)
+            except Exception as e:
+                ac.log("[AC_RL] Error writing telemetry file: %s" % e)
+                try:
+                    file_log("Error writing telemetry file: %s" % e)
+                except Exception:
+                    pass
     except Exception as e:
-        ac.log("[AC_RL] Error updating tyre labels: %s" % e)
+        ac.log("[AC_RL] Error preparing telemetry payload: %s" % e)
         try:
-            file_log("Error updating tyre labels: %s" % e)
+            file_log("Error preparing telemetry payload: %s" % e)
         except Exception:
             pass
 
+    _flush_log()
+
 
 def acShutdown():
     global telemetry_sock, input_sock
@@ -678,3 +1241,5 @@ def acShutdown():
                 pass
     except Exception:
         pass
+
+    _flush_log(force=True)
@@ -0,0 +1,96 @@
+"""AC_RL telemetry wire schema: msgspec Structs shared by the app and the receiver."""
+
+from typing import List, Optional, Union
+
+import msgspec
+
+
+class Session(msgspec.Struct):
+    session_type: Optional[int] = None
+    driver_name: Optional[str] = None
+    track_name: Optional[str] = None
+    track_config: Optional[str] = None
+    track_length: Optional[float] = None
+    cars_count: Optional[int] = None
+    session_status: Optional[int] = None
+    air_temp: Optional[float] = None
+    road_temp: Optional[float] = None
+
+
+class Car(msgspec.Struct):
+    speed_kmh: Optional[float] = None
+    speed_mph: Optional[float] = None
+    speed_ms: Optional[float] = None
+    location: Optional[float] = None
+    world_location: Optional[List[float]] = None
+    position: Optional[int] = None
+    drs_available: Optional[int] = None
+    drs_enabled: Optional[int] = None
+    gear: Optional[str] = None
+    rpm: Optional[float] = None
+    fuel: Optional[float] = None
+    tyres_off_track: Optional[int] = None
+    in_pit_lane: Optional[int] = None
+    damage: Optional[List[float]] = None
+    cg_height: Optional[float] = None
+    drive_train_speed: Optional[float] = None
+    velocity: Optional[List[float]] = None
+    acceleration: Optional[List[float]] = None
+
+
+class Inputs(msgspec.Struct):
+    gas: Optional[float] = None
+    brake: Optional[float] = None
+    clutch: Optional[float] = None
+    steer: Optional[float] = None
+    last_ff: Optional[float] = None
+
+
+class Lap(msgspec.Struct):
+    get_current_lap_time: Optional[float] = None
+    get_last_lap_time: Optional[float] = None
+    get_best_lap_time: Optional[float] = None
+    get_splits: Optional[List[float]] = None
+    get_split: Optional[str] = None
+    # LapInvalidated flag, or a bool when the off-track check decides it
+    get_invalid: Union[int, bool, None] = None
+    get_lap_count: Optional[int] = None
+    # int in a race, "-" otherwise
+    get_laps: Union[int, str, None] = None
+    get_lap_delta: Optional[float] = None
+    get_current_sector: Optional[int] = None
+
+
+class Tyres(msgspec.Struct):
+    """One list per field, indexed by tyre (0 = FL, 1 = FR, 2 = RL, 3 = RR)."""
+
+    wear: List[Optional[float]] = []
+    dirty: List[Optional[float]] = []
+    pressure: List[Optional[float]] = []
+    temp_i: List[Optional[float]] = []
+    temp_m: List[Optional[float]] = []
+    temp_o: List[Optional[float]] = []
+    slip_ratio: List[Optional[float]] = []
+    slip_angle: List[Optional[float]] = []
+    heading_vector: List[Optional[List[float]]] = []
+    angular_speed: List[Optional[float]] = []
+
+
+class Stats(msgspec.Struct):
+    has_drs: Optional[int] = None
+    has_ers: Optional[int] = None
+    has_kers: Optional[int] = None
+    abs_level: Optional[float] = None
+    max_rpm: Optional[int] = None
+    max_fuel: Optional[float] = None
+
+
+class Payload(msgspec.Struct):
+    app: str = "AC_RL"
+    timestamp: float = 0.0
+    session: Optional[Session] = None
+    car: Optional[Car] = None
+    inputs: Optional[Inputs] = None
+    lap: Optional[Lap] = None
+    tyres: Optional[Tyres] = None
+    stats: Optional[Stats] = None
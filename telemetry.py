@@ -1,13 +1,43 @@
+# Listens for AC_RL telemetry on 127.0.0.1:9876 and prints the latest packet once a
+# second. Datagrams are msgpack decoded into schema.Payload by default, or
+# JSON when the app runs with AC_RL_TELEMETRY_FORMAT=json.
+#
+# Commands go the other way, as UDP datagrams to the app's input port (9877):
+#   - a JSON object, e.g. {"reset": true} or {"telemetry_udp_port": 9876}
+#   - a single opcode byte, handled without any JSON parsing:
+#       b"\x01"  reset the car                 ({"reset": true})
+#       b"\x02"  enable UDP telemetry output   ({"use_udp_telemetry": true})
 import socket
 import time
 import json
 
+try:
+    import msgspec
+    from schema import Payload
+
+    decoder = msgspec.msgpack.Decoder(Payload)
+except ImportError:
+    decoder = None
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:
+
+    def loads(data):
+        return json.loads(bytes(data))
+
+
+# maps every non-printable byte to "." for the hexdump ascii column
+_ASCII_TRANS = bytes(c if 32 <= c < 127 else 46 for c in range(256))
+
 
 def hexdump(b, width=16):
     for i in range(0, len(b), width):
         chunk = b[i : i + width]
-        hexbytes = " ".join(f"{x:02x}" for x in chunk)
-        ascii_part = "".join(chr(x) if 32 <= x < 127 else "." for x in chunk)
+        hexbytes = chunk.hex(" ")
+        ascii_part = chunk.translate(_ASCII_TRANS).decode("latin1")
         print(f"{i:08x}  {hexbytes:<{width*3}}  {ascii_part}")
 
 
@@ -17,42 +47,57 @@ s.bind(("127.0.0.1", 9876))
 # set a short timeout so we can batch/aggregate packets and only print once a second
 s.settimeout(0.1)
 
+# one receive buffer for the whole run; packets are decoded from views into it
+buf = bytearray(65536)
+view = memoryview(buf)
+
 last_print = 0.0
-last_pkt = None
+last_len = None
+last_addr = None
 pkt_count = 0
 try:
     while True:
         try:
-            data, addr = s.recvfrom(65536)
-            last_pkt = (data, addr)
+            last_len, last_addr = s.recvfrom_into(buf)
             pkt_count += 1
         except socket.timeout:
             pass
 
         now = time.time()
-        if last_pkt and (now - last_print) >= 1.0:
-            data, addr = last_pkt
-            print(f"got {pkt_count} packets, last {len(data)} bytes from {addr}")
+        if last_len is not None and (now - last_print) >= 1.0:
+            data = view[:last_len]
+            print(f"got {pkt_count} packets, last {last_len} bytes from {last_addr}")
+
+            if decoder is not None:
+                try:
+                    obj = msgspec.to_builtins(decoder.decode(data).inputs)
+                    print(json.dumps(obj, indent=2))
+                    last_print = now
+                    last_len = None
+                    pkt_count = 0
+                    continue
+                except msgspec.DecodeError:
+                    pass
 
             try:
-                text = data.decode("utf-8")
-            except UnicodeDecodeError:
-                print("binary data:")
-                hexdump(data)
+                obj = loads(data)["inputs"]
+                print(json.dumps(obj, indent=2))
                 last_print = now
-                last_pkt = None
+                last_len = None
                 pkt_count = 0
                 continue
+            except ValueError:
+                pass
 
             try:
-                obj = json.loads(text)["inputs"]
-                print(json.dumps(obj, indent=2))
+                text = bytes(data).decode("utf-8")
+            except UnicodeDecodeError:
+                print("binary data:")
+                hexdump(bytes(data))
                 last_print = now
-                last_pkt = None
+                last_len = None
                 pkt_count = 0
                 continue
-            except (ValueError, json.JSONDecodeError):
-                pass
 
             # printable text?
             if all(32 <= ord(c) < 127 or c in "\r\n\t" for c in text):
@@ -61,7 +106,7 @@ try:
                 print("something wrong cuh")
 
             last_print = now
-            last_pkt = None
+            last_len = None
             pkt_count = 0
 finally:
     s.close()